@@ -4,10 +4,18 @@ Two asyncpg connection pools:
   public_pool    — public Supabase project  (Transaction pooler, port 6543)
 
 Both are initialised at startup via the FastAPI lifespan hook in main.py.
+
+Sync helpers that take a psycopg2 cursor (utils.chart_utils.get_stat_history_from_db)
+run in worker threads and borrow connections from a small per-DSN psycopg2
+ThreadedConnectionPool via pg_connection(), instead of paying a fresh
+TCP + TLS + auth handshake on every chart request.
 """
 
 import asyncpg
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from api.core.config import get_settings
 
 logger = logging.getLogger(__name__)
@@ -48,3 +56,81 @@ async def close_pools() -> None:
         await personal_pool.close()
     if public_pool:
         await public_pool.close()
+    close_pg_pools()
+
+
+# ---------------------------------------------------------------------------
+# psycopg2 pools — sync helpers running under asyncio.to_thread
+# ---------------------------------------------------------------------------
+
+# psycopg2 pools keep at most minconn idle connections; extras opened during a
+# burst are closed when returned. maxconn mirrors the asyncpg pools' max_size.
+PG_POOL_MINCONN = 1
+PG_POOL_MAXCONN = 5
+# Same recycle window as asyncpg's max_inactive_connection_lifetime above —
+# Supabase drops idle pooler connections, so don't hand out ones idle longer.
+PG_MAX_IDLE_SECONDS = 300
+_PG_CONNECT_KWARGS = dict(sslmode="require", keepalives=1, keepalives_idle=30)
+
+_pg_pools: dict = {}
+_pg_last_used: dict[int, float] = {}
+_pg_lock = threading.Lock()
+
+
+def _get_pg_pool(dsn: str):
+    from psycopg2.pool import ThreadedConnectionPool
+    with _pg_lock:
+        pool = _pg_pools.get(dsn)
+        if pool is None:
+            pool = ThreadedConnectionPool(PG_POOL_MINCONN, PG_POOL_MAXCONN, dsn, **_PG_CONNECT_KWARGS)
+            _pg_pools[dsn] = pool
+        return pool
+
+
+@contextmanager
+def pg_connection(dsn: str):
+    """
+    Borrow a psycopg2 connection for dsn from its pool; returned on exit.
+
+    Connections go back rolled back to idle (the pool does this), and are
+    discarded instead if they were lost mid-request or sat idle past
+    PG_MAX_IDLE_SECONDS. When all PG_POOL_MAXCONN are checked out, a one-off
+    connection is opened and closed rather than failing the request.
+    """
+    from psycopg2.pool import PoolError
+    pool = _get_pg_pool(dsn)
+    try:
+        conn = pool.getconn()
+        # Freshly opened connections have no entry and count as just used
+        while time.monotonic() - _pg_last_used.pop(id(conn), time.monotonic()) > PG_MAX_IDLE_SECONDS:
+            pool.putconn(conn, close=True)
+            conn = pool.getconn()
+    except PoolError:
+        conn = None
+
+    if conn is None:
+        import psycopg2
+        logger.warning("psycopg2 pool exhausted — opening a one-off connection")
+        conn = psycopg2.connect(dsn, **_PG_CONNECT_KWARGS)
+        try:
+            yield conn
+        finally:
+            conn.close()
+        return
+
+    try:
+        yield conn
+    finally:
+        _pg_last_used[id(conn)] = time.monotonic()
+        pool.putconn(conn, close=bool(conn.closed))
+        if conn.closed:
+            # Lost mid-request, or closed by the pool as surplus over minconn
+            _pg_last_used.pop(id(conn), None)
+
+
+def close_pg_pools() -> None:
+    with _pg_lock:
+        for pool in _pg_pools.values():
+            pool.closeall()
+        _pg_pools.clear()
+        _pg_last_used.clear()
@@ -2,7 +2,9 @@
 FastAPI dependency injection helpers.
 """
 
+import hashlib
 import logging
+import time
 from typing import Annotated
 from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
@@ -32,15 +34,37 @@ async def require_api_key(x_api_key: str = Header(...)):
 # JWT helpers
 # ---------------------------------------------------------------------------
 
+# Verified-token cache — the frontend resends the same JWT on every request for
+# its 60 min lifetime, so skip the HMAC check + JSON parse on repeats.
+# Keyed by SHA-256 of the token (raw tokens aren't kept in memory) →
+# (payload, expires_at). Entries live at most 60 s and never past the token's
+# own exp; invalid/expired tokens are never cached.
+_TOKEN_CACHE_TTL = 60
+_TOKEN_CACHE_MAX = 10_000
+_token_cache: dict = {}
+
+
 def _decode_token(token: str) -> dict:
+    key = hashlib.sha256(token.encode()).digest()
+    entry = _token_cache.get(key)
+    if entry and time.time() < entry[1]:
+        return dict(entry[0])
+
     settings = get_settings()
     try:
-        return jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
+        payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
     except jwt.ExpiredSignatureError:
+        _token_cache.pop(key, None)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired")
     except jwt.PyJWTError:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
+    if "exp" in payload:
+        if len(_token_cache) >= _TOKEN_CACHE_MAX:
+            _token_cache.clear()
+        _token_cache[key] = (payload, min(payload["exp"], time.time() + _TOKEN_CACHE_TTL))
+    return dict(payload)
+
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer)],
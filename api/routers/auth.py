@@ -133,14 +133,10 @@ async def login(body: LoginRequest, conn: PersonalConn):
     )
 
     if row is None:
-        # New user — insert then re-fetch to get DB-generated user_id + is_trusted
-        await conn.execute(
-            "INSERT INTO dim.dim_users (user_email, role) VALUES ($1, $2)",
-            email, target_role,
-        )
+        # New user — RETURNING hands back the DB-generated user_id + is_trusted
         row = await conn.fetchrow(
-            "SELECT user_id, is_trusted FROM dim.dim_users WHERE user_email = $1",
-            email,
+            "INSERT INTO dim.dim_users (user_email, role) VALUES ($1, $2) RETURNING user_id, is_trusted",
+            email, target_role,
         )
         if row is None:
             raise HTTPException(status_code=500, detail="Failed to create user")
@@ -79,18 +79,14 @@ async def get_interactive_chart(
         top_stats = [r["stat_type"] for r in top_rows]
 
         # get_stat_history_from_db uses a psycopg2 cursor — run in thread
-        import psycopg2
         from api.core.config import get_settings
+        from api.core.database import pg_connection
         settings = get_settings()
         is_owner = user.get("is_owner", False)
         dsn = settings.personal_db_url if is_owner else settings.public_db_url
         def _fetch_history():
-            pg = psycopg2.connect(dsn, sslmode="require")
-            try:
-                with pg.cursor() as cur:
-                    return get_stat_history_from_db(cur, player_id, game_id, top_stats, timezone_str=tz, days_back=365)
-            finally:
-                pg.close()
+            with pg_connection(dsn) as pg, pg.cursor() as cur:
+                return get_stat_history_from_db(cur, player_id, game_id, top_stats, timezone_str=tz, days_back=365)
 
         data = await asyncio.to_thread(_fetch_history)
         chart_type = "line"
@@ -170,18 +166,14 @@ async def download_chart(body: DownloadChartRequest, conn: DynamicConn, user: Cu
         """, body.player_id, body.game_id)
         top_stats = [r["stat_type"] for r in top_rows]
 
-        import psycopg2
         from api.core.config import get_settings
+        from api.core.database import pg_connection
         settings = get_settings()
         is_owner = user.get("is_owner", False)
         dsn = settings.personal_db_url if is_owner else settings.public_db_url
         def _fetch_history():
-            pg = psycopg2.connect(dsn, sslmode="require")
-            try:
-                with pg.cursor() as cur:
-                    return get_stat_history_from_db(cur, body.player_id, body.game_id, top_stats, days_back=30)
-            finally:
-                pg.close()
+            with pg_connection(dsn) as pg, pg.cursor() as cur:
+                return get_stat_history_from_db(cur, body.player_id, body.game_id, top_stats, days_back=30)
 
         stat_history = await asyncio.to_thread(_fetch_history)
         image_buffer = await asyncio.to_thread(
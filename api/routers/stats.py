@@ -425,12 +425,9 @@ async def add_stats(body: AddStatsRequest, conn: DynamicConn, user: CurrentUser)
                            "Upgrade to add more.",
                 )
         print(f"[stats] Player '{body.player_name}' for user {user_id} not found — creating.")
-        await conn.execute(
-            "INSERT INTO dim.dim_players (player_name, user_id, created_at) VALUES ($1, $2, NOW())",
-            body.player_name, user_id,
-        )
         player_id = await conn.fetchval(
-            "SELECT player_id FROM dim.dim_players WHERE player_name = $1 AND user_id = $2",
+            "INSERT INTO dim.dim_players (player_name, user_id, created_at)"
+            " VALUES ($1, $2, NOW()) RETURNING player_id",
             body.player_name, user_id,
         )
         if player_id is None:
@@ -454,18 +451,8 @@ async def add_stats(body: AddStatsRequest, conn: DynamicConn, user: CurrentUser)
     # --- Stat insertion (shared batch timestamp) ---
     batch_timestamp = await conn.fetchval("SELECT NOW()")
 
-    inserted = 0
-    for s in body.stats:
-        if not s.stat_type or s.stat_value is None:
-            continue
-        await conn.execute("""
-            INSERT INTO fact.fact_game_stats
-            (game_id, player_id, stat_type, stat_value, game_mode, solo_mode, party_size,
-             game_level, win, ranked, pre_match_rank_value, post_match_rank_value,
-             overtime, difficulty, input_device, platform, first_session_of_day, was_streaming,
-             source, played_at)
-            VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15,$16,$17,$18,$19,$20)
-        """,
+    stat_rows = [
+        (
             game_id, player_id, s.stat_type, s.stat_value,
             s.game_mode, s.solo_mode, s.party_size,
             s.game_level, s.win, s.ranked,
@@ -475,11 +462,24 @@ async def add_stats(body: AddStatsRequest, conn: DynamicConn, user: CurrentUser)
             s.first_session_of_day, s.was_streaming,
             s.source, batch_timestamp,
         )
-        inserted += 1
-
-    if inserted == 0:
+        for s in body.stats
+        if s.stat_type and s.stat_value is not None
+    ]
+    if not stat_rows:
         raise HTTPException(status_code=400, detail="No valid stats provided to insert.")
 
+    # executemany pipelines every row in one round-trip and is atomic — a
+    # failing row no longer leaves a partial session behind
+    await conn.executemany("""
+        INSERT INTO fact.fact_game_stats
+        (game_id, player_id, stat_type, stat_value, game_mode, solo_mode, party_size,
+         game_level, win, ranked, pre_match_rank_value, post_match_rank_value,
+         overtime, difficulty, input_device, platform, first_session_of_day, was_streaming,
+         source, played_at)
+        VALUES ($1,$2,$3,$4,$5,$6,$7,$8,$9,$10,$11,$12,$13,$14,$15,$16,$17,$18,$19,$20)
+    """, stat_rows)
+    inserted = len(stat_rows)
+
     print(f"[stats] {inserted} stat(s) inserted for player {player_id} / game {game_id} by {user['email']}")
 
     # Invalidate OBS dashboard/ticker cache so next poll reflects new stats
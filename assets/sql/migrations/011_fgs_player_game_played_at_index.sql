@@ -0,0 +1,22 @@
+-- Migration 011: Composite index for per-player/game date-range reads on fact_game_stats.
+-- Run against BOTH personal and public Supabase DBs.
+-- Safe to re-run — uses IF NOT EXISTS / IF EXISTS.
+--
+-- Chart history (utils/chart_utils.get_stat_history_from_db) and the
+-- instagram_poster queries that pin one player AND game select a played_at
+-- range. With played_at as the third key these become a single index range
+-- scan, and INCLUDE (stat_type, stat_value) lets the history query be served
+-- from the index alone. instagram_poster date filters on player_id alone
+-- (daily/weekly/yearly summaries) keep using idx_fgs_played_at.
+--
+-- idx_fgs_player_game (player_id, game_id) is a prefix of the new index, so it
+-- is dropped — otherwise every stat insert maintains both.
+--
+-- CONCURRENTLY avoids locking writes while building/dropping (run each
+-- statement outside a transaction block).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_fgs_player_game_played_at
+    ON fact.fact_game_stats (player_id, game_id, played_at)
+    INCLUDE (stat_type, stat_value);
+
+DROP INDEX CONCURRENTLY IF EXISTS fact.idx_fgs_player_game;
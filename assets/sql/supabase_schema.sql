@@ -468,12 +468,14 @@ CREATE TRIGGER trg_dim_users_updated_at
 -- PERFORMANCE INDEXES                                  [BOTH]
 -- ══════════════════════════════════════════════════════════════
 
-CREATE INDEX IF NOT EXISTS idx_fgs_player_game
-    ON fact.fact_game_stats (player_id, game_id);
-
 CREATE INDEX IF NOT EXISTS idx_fgs_played_at
     ON fact.fact_game_stats (played_at DESC);
 
+-- Also serves (player_id, game_id) lookups — replaces idx_fgs_player_game (migration 011)
+CREATE INDEX IF NOT EXISTS idx_fgs_player_game_played_at
+    ON fact.fact_game_stats (player_id, game_id, played_at)
+    INCLUDE (stat_type, stat_value);
+
 CREATE INDEX IF NOT EXISTS idx_fgs_game_stat_type
     ON fact.fact_game_stats (game_id, stat_type);
 
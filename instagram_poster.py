@@ -26,7 +26,7 @@ import os
 import sys
 import psycopg2
 import time
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from zoneinfo import ZoneInfo
 import random
 import io
@@ -113,6 +113,25 @@ def get_field_value(field):
     return field
 
 
+def _local_dates_sql(column='played_at'):
+    """
+    WHERE fragment: `column` falls on a local date (TIMEZONE_STR) in [%s, %s].
+
+    Compares the raw TIMESTAMPTZ column against the local-midnight bounds
+    instead of casting every row with (played_at AT TIME ZONE tz)::DATE, so
+    Postgres can range-scan played_at — via idx_fgs_played_at for player-wide
+    filters, or idx_fgs_player_game_played_at when game_id is pinned too.
+    Pair with _local_dates_params().
+    """
+    return (f"{column} >= %s::DATE::TIMESTAMP AT TIME ZONE %s "
+            f"AND {column} < (%s::DATE + 1)::TIMESTAMP AT TIME ZONE %s")
+
+
+def _local_dates_params(date_from, date_to=None):
+    """Params for _local_dates_sql(); date_to defaults to a single day."""
+    return (date_from, TIMEZONE_STR, date_to if date_to is not None else date_from, TIMEZONE_STR)
+
+
 def _resolve_player_id(player_name: str) -> int:
     """Resolve PLAYER_ID from SOCIAL_PLAYER_NAME env var at startup."""
     if not player_name:
@@ -199,13 +218,13 @@ def generate_content_hash(stats, game_name, date_str=None):
 def check_games_on_date(player_id, target_date):
     """Check if player has games on a specific date"""
     records = execute_query(
-        """
+        f"""
         SELECT COUNT(DISTINCT stat_id)
         FROM fact.fact_game_stats
         WHERE player_id = %s
-        AND (played_at AT TIME ZONE %s)::DATE = %s;
+        AND {_local_dates_sql()};
         """,
-        (player_id, TIMEZONE_STR, target_date)
+        (player_id, *_local_dates_params(target_date))
     )
     count = get_field_value(records[0][0]) if records else 0
     return count > 0
@@ -258,7 +277,7 @@ def get_stats_for_date(player_id, game_id, target_date, game_mode=None, aggregat
     share the same mode).
     """
     agg_expr = 'ROUND(AVG(stat_value))' if aggregate == 'avg' else 'MAX(stat_value)'
-    params = [player_id, game_id, TIMEZONE_STR, target_date]
+    params = [player_id, game_id, *_local_dates_params(target_date)]
     mode_clause = ''
     if game_mode:
         mode_clause = 'AND game_mode = %s'
@@ -272,7 +291,7 @@ def get_stats_for_date(player_id, game_id, target_date, game_mode=None, aggregat
         FROM fact.fact_game_stats
         WHERE player_id = %s
           AND game_id = %s
-          AND (played_at AT TIME ZONE %s)::DATE = %s
+          AND {_local_dates_sql()}
           {mode_clause}
         GROUP BY stat_type
         ORDER BY agg_value DESC
@@ -289,7 +308,7 @@ def get_match_count_for_date(player_id, game_id, target_date, game_mode=None):
     date.  Each form submission shares one played_at so this equals # of
     submitted sessions.  Returns 1 as a safe fallback.
     """
-    params = [player_id, game_id, TIMEZONE_STR, target_date]
+    params = [player_id, game_id, *_local_dates_params(target_date)]
     mode_clause = ''
     if game_mode:
         mode_clause = 'AND game_mode = %s'
@@ -302,7 +321,7 @@ def get_match_count_for_date(player_id, game_id, target_date, game_mode=None):
             FROM fact.fact_game_stats
             WHERE player_id = %s
               AND game_id = %s
-              AND (played_at AT TIME ZONE %s)::DATE = %s
+              AND {_local_dates_sql()}
               {mode_clause};
             """,
             tuple(params)
@@ -322,14 +341,13 @@ def get_most_recent_date_in_range(player_id, date_min, date_max):
     """
     try:
         records = execute_query(
-            """
+            f"""
             SELECT MAX((played_at AT TIME ZONE %s)::DATE) AS most_recent
             FROM fact.fact_game_stats
             WHERE player_id = %s
-              AND (played_at AT TIME ZONE %s)::DATE
-                  BETWEEN %s AND %s;
+              AND {_local_dates_sql()};
             """,
-            (TIMEZONE_STR, player_id, TIMEZONE_STR, date_min, date_max)
+            (TIMEZONE_STR, player_id, *_local_dates_params(date_min, date_max))
         )
         val = get_field_value(records[0][0]) if records else None
         if not val:
@@ -343,7 +361,7 @@ def get_most_recent_date_in_range(player_id, date_min, date_max):
 def get_stats_for_date_all_games(player_id, target_date):
     """Get stats for all games on a specific date"""
     records = execute_query(
-        """
+        f"""
         SELECT
             g.game_name,
             g.game_installment,
@@ -352,10 +370,10 @@ def get_stats_for_date_all_games(player_id, target_date):
         FROM fact.fact_game_stats f
         JOIN dim.dim_games g ON f.game_id = g.game_id
         WHERE f.player_id = %s
-        AND (f.played_at AT TIME ZONE %s)::DATE = %s
+        AND {_local_dates_sql('f.played_at')}
         ORDER BY f.stat_value DESC;
         """,
-        (player_id, TIMEZONE_STR, target_date)
+        (player_id, *_local_dates_params(target_date))
     )
 
     return [{
@@ -374,12 +392,12 @@ def get_game_mode_for_date(player_id, game_id, target_date):
     all modes rather than silently excluding sessions.
     """
     records = execute_query(
-        """
+        f"""
         SELECT game_mode, COUNT(*) AS cnt
         FROM fact.fact_game_stats
         WHERE player_id = %s
           AND game_id = %s
-          AND (played_at AT TIME ZONE %s)::DATE = %s
+          AND {_local_dates_sql()}
           AND game_mode IS NOT NULL
           AND TRIM(game_mode) != ''
           AND LOWER(TRIM(game_mode)) != 'main'
@@ -387,7 +405,7 @@ def get_game_mode_for_date(player_id, game_id, target_date):
         ORDER BY cnt DESC, game_mode ASC
         LIMIT 2;
         """,
-        (player_id, game_id, TIMEZONE_STR, target_date)
+        (player_id, game_id, *_local_dates_params(target_date))
     )
     if len(records) > 1:
         return None  # Multiple modes played — don't filter, include all sessions
@@ -401,18 +419,18 @@ def get_all_modes_for_date(player_id, game_id, target_date):
     stat aggregation or chart generation.
     """
     records = execute_query(
-        """
+        f"""
         SELECT DISTINCT game_mode
         FROM fact.fact_game_stats
         WHERE player_id = %s
           AND game_id = %s
-          AND (played_at AT TIME ZONE %s)::DATE = %s
+          AND {_local_dates_sql()}
           AND game_mode IS NOT NULL
           AND TRIM(game_mode) != ''
           AND LOWER(TRIM(game_mode)) != 'main'
         ORDER BY game_mode ASC;
         """,
-        (player_id, game_id, TIMEZONE_STR, target_date)
+        (player_id, game_id, *_local_dates_params(target_date))
     )
     return [get_field_value(row[0]) for row in records]
 
@@ -420,7 +438,7 @@ def get_all_modes_for_date(player_id, game_id, target_date):
 def detect_anomalies(player_id, game_id, target_date):
     """Detect statistical anomalies for a specific date"""
     records = execute_query(
-        """
+        f"""
         WITH daily_stats AS (
             SELECT
                 f.stat_type,
@@ -430,7 +448,7 @@ def detect_anomalies(player_id, game_id, target_date):
             FROM fact.fact_game_stats f
             WHERE f.player_id = %s
             AND f.game_id = %s
-            AND (f.played_at AT TIME ZONE %s)::DATE = %s
+            AND {_local_dates_sql('f.played_at')}
         )
         SELECT
             stat_type,
@@ -443,7 +461,7 @@ def detect_anomalies(player_id, game_id, target_date):
         ORDER BY ABS((stat_value - avg_value) / NULLIF(stddev_value, 0)) DESC
         LIMIT 3;
         """,
-        (player_id, game_id, TIMEZONE_STR, target_date)
+        (player_id, game_id, *_local_dates_params(target_date))
     )
 
     anomalies = []
@@ -2507,16 +2525,15 @@ def run_tuesday_thursday_poster():
 def get_weekly_summary_data(player_id, week_start, week_end):
     """Fetch gaming summary for week_start–week_end (both inclusive)."""
     overview = execute_query(
-        """
+        f"""
         SELECT
             COUNT(DISTINCT game_id)   AS games_played,
             COUNT(DISTINCT played_at) AS sessions
         FROM fact.fact_game_stats
         WHERE player_id = %s
-          AND (played_at AT TIME ZONE %s)::DATE
-              BETWEEN %s AND %s;
+          AND {_local_dates_sql()};
         """,
-        (player_id, TIMEZONE_STR, week_start, week_end)
+        (player_id, *_local_dates_params(week_start, week_end))
     )
     if not overview:
         return None
@@ -2527,31 +2544,29 @@ def get_weekly_summary_data(player_id, week_start, week_end):
         return None
 
     top_stat = execute_query(
-        """
+        f"""
         SELECT stat_type, stat_value
         FROM fact.fact_game_stats
         WHERE player_id = %s
-          AND (played_at AT TIME ZONE %s)::DATE
-              BETWEEN %s AND %s
+          AND {_local_dates_sql()}
         ORDER BY stat_value DESC
         LIMIT 1;
         """,
-        (player_id, TIMEZONE_STR, week_start, week_end)
+        (player_id, *_local_dates_params(week_start, week_end))
     )
 
     top_day_raw = execute_query(
-        """
+        f"""
         SELECT (played_at AT TIME ZONE %s)::DATE AS play_date,
                COUNT(DISTINCT played_at) AS session_count
         FROM fact.fact_game_stats
         WHERE player_id = %s
-          AND (played_at AT TIME ZONE %s)::DATE
-              BETWEEN %s AND %s
+          AND {_local_dates_sql()}
         GROUP BY (played_at AT TIME ZONE %s)::DATE
         ORDER BY session_count DESC, play_date ASC
         LIMIT 1;
         """,
-        (TIMEZONE_STR, player_id, TIMEZONE_STR, week_start, week_end, TIMEZONE_STR)
+        (TIMEZONE_STR, player_id, *_local_dates_params(week_start, week_end), TIMEZONE_STR)
     )
 
     if top_day_raw:
@@ -2863,8 +2878,9 @@ def generate_gamer_type(genres_played):
 
 def get_yearly_recap_data(player_id, year):
     """Fetch all data needed for the yearly recap poster."""
+    year_params = _local_dates_params(date(year, 1, 1), date(year, 12, 31))
     game_records = execute_query(
-        """
+        f"""
         SELECT
             g.game_name,
             g.game_installment,
@@ -2874,11 +2890,11 @@ def get_yearly_recap_data(player_id, year):
         FROM fact.fact_game_stats f
         JOIN dim.dim_games g ON f.game_id = g.game_id
         WHERE f.player_id = %s
-          AND EXTRACT(YEAR FROM (f.played_at AT TIME ZONE %s)) = %s
+          AND {_local_dates_sql('f.played_at')}
         GROUP BY g.game_name, g.game_installment, g.game_genre, g.game_subgenre
         ORDER BY sessions DESC;
         """,
-        (player_id, TIMEZONE_STR, year)
+        (player_id, *year_params)
     )
     if not game_records:
         return None
@@ -2904,15 +2920,15 @@ def get_yearly_recap_data(player_id, year):
         g['pct'] = round(g['sessions'] / total_sessions * 100) if total_sessions > 0 else 0
 
     top_stat = execute_query(
-        """
+        f"""
         SELECT stat_type, stat_value
         FROM fact.fact_game_stats
         WHERE player_id = %s
-          AND EXTRACT(YEAR FROM (played_at AT TIME ZONE %s)) = %s
+          AND {_local_dates_sql()}
         ORDER BY stat_value DESC
         LIMIT 1;
         """,
-        (player_id, TIMEZONE_STR, year)
+        (player_id, *year_params)
     )
 
     gamer_type, gamer_tagline = generate_gamer_type(genres_seen)
@@ -14,31 +14,99 @@ Features:
 - Reduced height and improved spacing to prevent x-axis label overlap
 """
 
-import matplotlib.pyplot as plt
+import os
+import tempfile
+
+# matplotlib caches its font list (fontlist-*.json) under MPLCONFIGDIR. When the
+# home directory isn't writable (Lambda) it falls back to a new temp dir in every
+# process and rescans fonts on each cold start; pin it to a stable path so the
+# cache is reused by later processes (including the render workers).
+if not os.environ.get("MPLCONFIGDIR") and not os.access(os.path.expanduser("~"), os.W_OK):
+    os.environ["MPLCONFIGDIR"] = os.path.join(tempfile.gettempdir(), "matplotlib")
+
+import matplotlib
+
+# Charts only ever go to PNG bytes — select Agg up front so pyplot never probes
+# for a GUI backend (Tk/Qt) in headless containers, and keep interactive mode
+# off so nothing tries to redraw or show figures as they change
+matplotlib.use('Agg')
+matplotlib.interactive(False)
+
+# pyplot itself is not imported: figures are built on their own Agg canvas, and
+# skipping pyplot's state machine (figure managers, backend switching) takes
+# ~10% off this module's import time.
+from matplotlib.artist import setp
 import matplotlib.font_manager as fm
 import matplotlib.dates as mdates
 import matplotlib.patheffects as pe
-import seaborn as sns
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter, LogLocator
+from matplotlib.transforms import Bbox, IdentityTransform
 from datetime import datetime
 from zoneinfo import ZoneInfo
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, wraps
+from operator import itemgetter
 import io
-import os
+import math
+import multiprocessing
+import struct
+import threading
+import zlib
 import numpy as np
+from PIL import Image, ImageDraw, ImageFont
 from utils.holiday_themes import get_themed_colors
 
-TIMEZONE_STR = os.environ.get("TIMEZONE", "America/Los_Angeles")
+try:
+    import fpnge  # optional SIMD PNG encoder
+except ImportError:
+    fpnge = None
 
-# Set style for professional-looking charts
-sns.set_style("darkgrid")
-plt.rcParams['figure.facecolor'] = '#1a1a1a'  # Dark background
-plt.rcParams['axes.facecolor'] = '#2d2d2d'
-plt.rcParams['text.color'] = 'white'
-plt.rcParams['axes.labelcolor'] = 'white'
-plt.rcParams['xtick.color'] = 'white'
-plt.rcParams['ytick.color'] = 'white'
-plt.rcParams['grid.color'] = '#404040'
+TIMEZONE_STR = os.environ.get("TIMEZONE", "America/Los_Angeles")
+TWITCH_HANDLE = os.environ.get("TWITCH_HANDLE", "TheBOLBroadcast")
+
+# Keys of the per-stat entries in stat_data / stat_history dicts, in order
+_STAT_KEYS = ('stat1', 'stat2', 'stat3')
+
+# Draw linear-scale bar charts straight onto a Pillow canvas instead of going
+# through matplotlib (see _fast_bar_chart). Off by default.
+USE_FAST_RENDERER = os.environ.get("USE_FAST_RENDERER", "").strip().lower() in ("1", "true", "yes")
+
+# Set style for professional-looking charts, in one rcParams update.
+# Base: seaborn's "darkgrid" style keys, set directly so importing this module
+# doesn't pull in seaborn (and its pandas/scipy stack) just for set_style.
+matplotlib.rcParams.update({
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.edgecolor': 'white',
+    'grid.linestyle': '-',
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.top': False,
+    'ytick.right': False,
+    'xtick.bottom': False,
+    'ytick.left': False,
+    # Dark theme colors
+    'figure.facecolor': '#1a1a1a',  # Dark background
+    'axes.facecolor': '#2d2d2d',
+    'text.color': 'white',
+    'axes.labelcolor': 'white',
+    'xtick.color': 'white',
+    'ytick.color': 'white',
+    'grid.color': '#404040',
+    'font.size': 12,
+})
 
 # --- LOAD BUNDLED FIRA CODE FONTS ---
+# Loaded lazily on the first render (see _get_fig) rather than at import, and
+# only once per process — repeat calls return the first result.
+@lru_cache(maxsize=None)
 def load_custom_fonts():
     """Load Fira Code fonts from repository fonts directory"""
     # Get the directory where this script is located
@@ -65,7 +133,7 @@ def load_custom_fonts():
             print("🔄 Rebuilding font cache...")
             
             # Set Fira Code as default
-            plt.rcParams['font.family'] = 'Fira Code'
+            matplotlib.rcParams['font.family'] = 'Fira Code'
             print("✅ Fira Code set as default font")
             return True
         else:
@@ -73,30 +141,321 @@ def load_custom_fonts():
     else:
         print(f"⚠️ Fonts directory not found: {fonts_dir}")
     
+    # Explicit font file (e.g. a mounted/layered TTF) — no system scan needed
+    fira_code_path = os.environ.get("FIRA_CODE_PATH")
+    if fira_code_path and os.path.isfile(fira_code_path):
+        try:
+            fm.fontManager.addfont(fira_code_path)
+            matplotlib.rcParams['font.family'] = fm.FontProperties(fname=fira_code_path).get_name()
+            print(f"✅ Using Fira Code from FIRA_CODE_PATH: {fira_code_path}")
+            return True
+        except Exception as e:
+            print(f"⚠️ Failed to load FIRA_CODE_PATH {fira_code_path}: {e}")
+
     # Fallback to system fonts
     print("ℹ️ Using system fonts as fallback")
     try:
-        # Try system Fira Code
-        fira_code_fonts = [f for f in fm.findSystemFonts() 
-                          if 'FiraCode' in f or 'Fira Code' in f]
+        # Try system Fira Code — matplotlib's already-loaded font list, not a
+        # fresh filesystem walk via findSystemFonts()
+        fira_code_fonts = [f for f in fm.fontManager.ttflist
+                          if 'FiraCode' in f.name.replace(' ', '') or 'FiraCode' in os.path.basename(f.fname)]
         if fira_code_fonts:
-            plt.rcParams['font.family'] = 'Fira Code'
+            matplotlib.rcParams['font.family'] = 'Fira Code'
             print("✅ Using system Fira Code font")
             return True
     except:
         pass
     
     # Final fallback
-    plt.rcParams['font.family'] = 'monospace'
+    matplotlib.rcParams['font.family'] = 'monospace'
     print("ℹ️ Using monospace fallback font")
     return False
 
-# Load fonts when module is imported
-load_custom_fonts()
 
-plt.rcParams['font.size'] = 12
+# --- THEME CACHE ---
+# The theme only changes at local midnight, so resolve it once per (tz, day)
+# instead of re-running the holiday/heritage-month checks on every chart.
+_THEME_CACHE = {}
+
+
+def _cached_theme(tz=None):
+    """get_themed_colors(tz), memoized for the current local date in tz."""
+    zone = tz or TIMEZONE_STR
+    try:
+        today = datetime.now(ZoneInfo(zone)).date()
+    except Exception:
+        return get_themed_colors(tz)
+    cached = _THEME_CACHE.get(zone)
+    if cached is None or cached[0] != today:
+        cached = (today, get_themed_colors(tz))
+        _THEME_CACHE[zone] = cached
+    return cached[1]
+
+
+# --- FIGURE CACHE ---
+# Figures are reused across calls instead of being rebuilt with plt.subplots
+# and torn down with plt.close every time — figure/axes construction is a large
+# share of the cost for these small charts. One figure per (size, chart kind)
+# so per-kind axes state (log scale, hidden axis, axis('off')) never leaks.
+# The cached Figure/Axes objects in _FIG_CACHE are shared mutable state and
+# the API renders from worker threads (asyncio.to_thread), so every generator
+# holds _FIG_LOCK while clearing, drawing and encoding its figure.
+_FIG_CACHE = {}
+_FIG_LOCK = threading.RLock()
+
+
+def _get_fig(size, kind):
+    """Return a cleared (fig, ax) pair for this size and chart kind."""
+    load_custom_fonts()
+    key = (size, kind)
+    if key not in _FIG_CACHE:
+        figsize = (10.8, 10.8) if size == 'instagram' else (16, 9)
+        # Plain Figure on its own Agg canvas — never registered with pyplot, so
+        # the cached figures can't become plt's "current figure" for other code
+        fig = Figure(figsize=figsize, dpi=100)
+        FigureCanvasAgg(fig)
+        _FIG_CACHE[key] = (fig, fig.add_subplot())
+    fig, ax = _FIG_CACHE[key]
+    ax.clear()
+    # fig.text / fig.add_artist / fig.figimage output from the previous render
+    for artist in fig.texts[:] + fig.artists[:] + fig.images[:]:
+        artist.remove()
+    # Restore the default axes position — the line chart reads it before its
+    # own subplots_adjust, so the previous render's layout must not leak in.
+    fig.subplots_adjust(**{k: matplotlib.rcParams[f'figure.subplot.{k}']
+                           for k in ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')})
+    return fig, ax
+
+
+def _with_fig_lock(func):
+    """Serialize access to the cached figures."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with _FIG_LOCK:
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def _fit_axes_in_rect(fig, ax, rect):
+    """
+    Cheap stand-in for fig.tight_layout(rect=rect) on the single-axes charts.
+
+    tight_layout measures the tight bbox of every artist, which is nearly a
+    full draw. On these charts only the tick labels stick out of the axes, so
+    just those strings are measured and the same padding is applied
+    (1.08 x font.size around the edges, plus tick length + tick pad).
+    """
+    renderer = fig.canvas.get_renderer()
+    px = fig.dpi / 72
+    pad = 1.08 * matplotlib.rcParams['font.size'] * px
+    left = right = bottom = top = pad
+
+    if ax.axison:
+        # Y tick labels sit left of the axes
+        y_widths = [renderer.get_text_width_height_descent(t.get_text(), t.get_fontproperties(), ismath=False)[0]
+                    for t in ax.get_yticklabels() if t.get_visible() and t.get_text()]
+        if y_widths:
+            left += max(y_widths) + (matplotlib.rcParams['ytick.major.size'] + matplotlib.rcParams['ytick.major.pad']) * px
+
+        # X tick labels sit below; a tick at the right edge (log axis ending
+        # on a nice number) overhangs by half its label
+        x_labels = [t for t in ax.get_xticklabels() if t.get_visible()]
+        if x_labels:
+            _, h, _ = renderer.get_text_width_height_descent('lp', x_labels[0].get_fontproperties(), ismath=False)
+            bottom += h + (matplotlib.rcParams['xtick.major.size'] + matplotlib.rcParams['xtick.major.pad']) * px
+            xmin, xmax = ax.get_xlim()
+            ticks = [t for t in ax.get_xticks() if xmin <= t <= xmax * (1 + 1e-9)]
+            if ticks and np.isclose(ticks[-1], xmax):
+                last = ax.xaxis.get_major_formatter().format_ticks(ticks)[-1]
+                w, _, _ = renderer.get_text_width_height_descent(last, x_labels[0].get_fontproperties(), ismath=False)
+                right += w / 2
+
+    W, H = fig.bbox.width, fig.bbox.height
+    x0, y0, x1, y1 = rect
+    fig.subplots_adjust(left=x0 + left / W, right=x1 - right / W,
+                        bottom=y0 + bottom / H, top=y1 - top / H)
+
+
+@lru_cache(maxsize=16)
+def _branding_strip(fontsize, handle, offsets_px):
+    """
+    Render "YT & Twitch : handle" once as an RGBA array.
+
+    The four colored spans are laid out exactly as the charts used to place
+    them (span starts at offsets_px from the left) on a transparent canvas,
+    then cropped to the ink. Returns (rgba, dx, dy): the pixel offset of the
+    crop's lower-left corner from the text anchor.
+    """
+    spans = (('YT', '#FF0000', 'bold'), (' & ', 'white', 'normal'),
+             ('Twitch', '#9146FF', 'bold'), (f' : {handle}', 'white', 'bold'))
+    pad = fontsize
+    width_px = pad * 2 + offsets_px[-1] + len(spans[-1][0]) * fontsize * 2
+    fig = Figure(figsize=(width_px / 100, fontsize * 3 / 100), dpi=100)
+    canvas = FigureCanvasAgg(fig)
+    fig.patch.set_alpha(0)
+    texts = [fig.text(pad + x, pad, text, ha='left', va='bottom', transform=IdentityTransform(),
+                      fontsize=fontsize, color=color, fontweight=weight)
+             for x, (text, color, weight) in zip((0,) + offsets_px, spans)]
+    canvas.draw()
+    ink = Bbox.union([t.get_window_extent() for t in texts])
+    x0, y0 = int(np.floor(ink.x0)), int(np.floor(ink.y0))
+    x1, y1 = int(np.ceil(ink.x1)), int(np.ceil(ink.y1))
+    height = int(fig.bbox.height)
+    rgba = np.asarray(canvas.buffer_rgba())[height - y1:height - y0, x0:x1].copy()
+    return rgba, x0 - pad, y0 - pad
+
+
+def _add_branding(fig, x, y, fontsize, offsets):
+    """Blit the cached branding strip with its left/bottom edge at figure fraction (x, y)."""
+    W = fig.bbox.width
+    rgba, dx, dy = _branding_strip(fontsize, TWITCH_HANDLE, tuple(round(o * W) for o in offsets))
+    fig.figimage(rgba, xo=round(x * W) + dx, yo=round(y * fig.bbox.height) + dy,
+                 origin='upper', zorder=3)
+
+
+def _timestamp_str():
+    """Today's date for the chart footer, e.g. 'March 05, 2026'."""
+    try:
+        return datetime.now(ZoneInfo(TIMEZONE_STR)).strftime('%B %d, %Y')
+    except Exception:
+        return datetime.now().strftime('%B %d, %Y')
+
 
+def _add_footer(fig, y, fontsize, offsets, game_mode=None):
+    """
+    Footer row shared by the matplotlib charts at figure-fraction height y:
+    branding (left), game mode tag (center), timestamp (right).
+    """
+    fig.text(0.99, y, _timestamp_str(), ha='right', va='bottom',
+             fontsize=fontsize, color='gray', style='italic')
 
+    # Game mode tag (centered between handles and date)
+    _mode_tag = abbreviate_game_mode(game_mode) if game_mode else None
+    if _mode_tag:
+        fig.text(0.5, y, f' {_mode_tag} ', ha='center', va='bottom',
+                 fontsize=fontsize, color='white', fontweight='bold',
+                 bbox=dict(boxstyle='round,pad=0.3', facecolor='none', edgecolor='white', linewidth=1.5))
+
+    # Multi-platform branding (YT & Twitch : handle)
+    _add_branding(fig, 0.01, y, fontsize, offsets)
+
+
+def _add_title(fig, line1, full_game_name, theme, title_fontsize, fig_height_pts, styled=True):
+    """
+    Centered title block shared by the matplotlib charts, starting at y=0.96:
+    line1 (white), "Game: Installment" (white) and, for heritage months and
+    holidays, the theme name in the theme's third color. With styled, line1
+    gets the neon glow (gaming theme) or a drop shadow (holiday themes).
+
+    Returns the figure-fraction y just below the title (the axes' top limit).
+    """
+    colors = theme['colors']
+    y_position = 0.96  # Start near top
+    # Line spacing proportional to font height in figure-fraction coordinates
+    line_spacing = (title_fontsize / fig_height_pts) * 1.30
+
+    # Line 1 - WHITE
+    if not styled:
+        fig.text(0.5, y_position, line1, ha='center', va='top',
+                 fontsize=title_fontsize, fontweight='bold', color='white',
+                 transform=fig.transFigure)
+    elif theme['theme_name'] == 'Gaming':
+        fig.text(0.5, y_position, line1, ha='center', va='top',
+                 fontsize=title_fontsize, fontweight='bold', color='white',
+                 transform=fig.transFigure,
+                 path_effects=[pe.withStroke(linewidth=4, foreground=colors[0])])
+    else:
+        fig.text(0.503, y_position - 0.003, line1, ha='center', va='top',
+                 fontsize=title_fontsize, fontweight='bold', color='#000000',
+                 alpha=0.45, transform=fig.transFigure)
+        fig.text(0.5, y_position, line1, ha='center', va='top',
+                 fontsize=title_fontsize, fontweight='bold', color='white',
+                 transform=fig.transFigure)
+    y_position -= line_spacing
+
+    # Line 2: "Game: Installment" - WHITE
+    fig.text(0.5, y_position, full_game_name, ha='center', va='top',
+             fontsize=title_fontsize, fontweight='bold', color='white',
+             transform=fig.transFigure)
+    y_position -= line_spacing
+
+    # Line 3 (OPTIONAL): Heritage month/holiday name - THIRD COLOR
+    if theme['show_in_title']:
+        theme_color = colors[2] if len(colors) > 2 else colors[0]
+        fig.text(0.5, y_position, theme['theme_name'], ha='center', va='top',
+                 fontsize=title_fontsize, fontweight='bold', color=theme_color,
+                 transform=fig.transFigure)
+
+    # 2 title lines normally, 3 with holiday theme
+    n_title_lines = 3 if theme['show_in_title'] else 2
+    return 0.96 - n_title_lines * line_spacing
+
+
+# PNG encode settings for every chart. zlib level 1 encodes several times
+# faster than the default (6) at a modestly larger file — Twitter and
+# Instagram re-encode uploads anyway.
+_PNG_ZLIB_LEVEL = 1
+
+# Quantize charts to a 256-color palette PNG before encoding. Roughly halves
+# the file (faster uploads) at the cost of ~10 ms of quantizing per chart and
+# a slight color shift on anti-aliased edges. Off by default.
+CHART_PNG_PALETTE = os.environ.get("CHART_PNG_PALETTE", "").strip().lower() in ("1", "true", "yes")
+
+
+def _png_chunk(tag, data):
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+
+def _encode_png(pixels):
+    """
+    Encode an (H, W, 3|4) uint8 array as PNG bytes.
+
+    Every row uses PNG filter type 0 (None). Pillow/libpng try all five row
+    filters per line, which costs more than it saves on these flat-colored
+    chart images — unfiltered rows deflate to about the same size, about
+    twice as fast.
+
+    When the optional fpnge package is installed it is used instead; it
+    encodes several times faster again. With CHART_PNG_PALETTE set, the
+    image is quantized and written as a palette PNG by Pillow.
+    """
+    if CHART_PNG_PALETTE:
+        buf = io.BytesIO()
+        Image.fromarray(pixels).quantize(colors=256, method=Image.Quantize.FASTOCTREE).save(
+            buf, format='PNG', compress_level=_PNG_ZLIB_LEVEL)
+        return buf.getvalue()
+    if fpnge is not None:
+        return fpnge.fromarray(np.ascontiguousarray(pixels))
+    h, w, channels = pixels.shape
+    raw = np.empty((h, w * channels + 1), dtype=np.uint8)
+    raw[:, 0] = 0  # filter type byte
+    raw[:, 1:] = pixels.reshape(h, -1)
+    color_type = 6 if channels == 4 else 2  # RGBA / RGB
+    return b''.join((
+        b'\x89PNG\r\n\x1a\n',
+        _png_chunk(b'IHDR', struct.pack('>IIBBBBB', w, h, 8, color_type, 0, 0, 0)),
+        _png_chunk(b'IDAT', zlib.compress(raw.tobytes(), _PNG_ZLIB_LEVEL)),
+        _png_chunk(b'IEND', b''),
+    ))
+
+
+def _write_png(fig, out=None):
+    """
+    Encode fig as PNG into out (any writable binary stream), or into a new
+    rewound BytesIO when out is None. Returns the stream written to.
+    """
+    fig.canvas.draw()
+    # Chart backgrounds are opaque, so the alpha channel carries nothing
+    data = _encode_png(np.asarray(fig.canvas.buffer_rgba())[..., :3])
+    if out is None:
+        return io.BytesIO(data)
+    out.write(data)
+    return out
+
+
+# Pure functions of a small, repeating vocabulary (stat names / values), so
+# memoize them — the same labels recur on every chart for a game.
+@lru_cache(maxsize=512)
 def abbreviate_stat(stat_name):
     """
     Abbreviate stat name for cleaner chart display.
@@ -153,6 +512,7 @@ def abbreviate_stat(stat_name):
     return single_word.upper()
 
 
+@lru_cache(maxsize=128)
 def abbreviate_game_mode(game_mode):
     """
     Create a short display tag from a game mode name.
@@ -185,15 +545,18 @@ def format_large_number(value):
         1000000 -> "1.0M"
         50 -> "50"
     """
-    if not isinstance(value, (int, float)):
-        try:
-            value = float(value)  # handles decimal.Decimal from psycopg2 NUMERIC columns
-        except (TypeError, ValueError):
-            return str(value)
-    
-     
+    # Coerce before the cache so unhashable input (lists, arrays) still gets str()
+    try:
+        value = float(value)  # handles decimal.Decimal from psycopg2 NUMERIC columns
+    except (TypeError, ValueError):
+        return str(value)
+    return _format_large_float(value)
+
+
+@lru_cache(maxsize=1024)
+def _format_large_float(value):
     if value >= 1_000_000_000_000:
-        return f"{value/1_000_000_000:.1f}T"
+        return f"{value/1_000_000_000_000:.1f}T"
     elif value >= 1_000_000_000:
         return f"{value/1_000_000_000:.1f}B"
     elif value >= 1_000_000:
@@ -213,12 +576,12 @@ def should_use_log_scale(values):
     - This indicates highly skewed data (e.g., [600, 2, 2, 1])
     
     Args:
-        values: list of numeric values
+        values: list (or 1-D array) of numeric values
     
     Returns:
         bool: True if log scale should be used
     """
-    if not values or len(values) < 2:
+    if values is None or len(values) < 2:
         return False
     
     # Filter out zeros for ratio calculation
@@ -228,21 +591,26 @@ def should_use_log_scale(values):
     else:
         numeric_values = values
     
-    _non_zero = []
-    for v in numeric_values:
-        try:
-            fv = float(v)
-            if fv > 0:
-                _non_zero.append(fv)
-        except (TypeError, ValueError):
-            pass
-    non_zero_values = _non_zero
-
-    if not non_zero_values or len(non_zero_values) < 2:
+    try:
+        arr = np.asarray(numeric_values, dtype=np.float64)
+    except (TypeError, ValueError):
+        # Mixed in a non-numeric entry — skip just those, element by element
+        _numeric = []
+        for v in numeric_values:
+            try:
+                _numeric.append(float(v))
+            except (TypeError, ValueError):
+                pass
+        arr = np.asarray(_numeric, dtype=np.float64)
+    non_zero_values = arr[arr > 0]
+
+    if non_zero_values.size < 2:
         return False
     
-    max_val = max(non_zero_values)
-    median_val = sorted(non_zero_values)[len(non_zero_values) // 2]
+    max_val = non_zero_values.max()
+    # Upper median (same element sorted()[n // 2] picks), in O(n)
+    mid = non_zero_values.size // 2
+    median_val = np.partition(non_zero_values, mid)[mid]
     
     # Use log scale if max is 100x or more than median
     ratio = max_val / median_val if median_val > 0 else 0
@@ -254,6 +622,29 @@ def should_use_log_scale(values):
     return False
 
 
+def _log_formatter(x, pos):
+    """Format log scale labels to show actual values"""
+    if x >= 1000:
+        return f'{int(x/1000)}k'
+    elif x >= 1:
+        return f'{int(x)}'
+    else:
+        return f'{x:.1f}'
+
+
+def _nice_log_max(max_val):
+    """Smallest 1/2/5 × 10^n at or above max_val * 1.1 — log axis upper limit."""
+    magnitude = 10 ** math.floor(math.log10(max_val * 1.1))
+    normalized = (max_val * 1.1) / magnitude
+    if normalized <= 1:
+        return 1 * magnitude
+    elif normalized <= 2:
+        return 2 * magnitude
+    elif normalized <= 5:
+        return 5 * magnitude
+    return 10 * magnitude
+
+
 def format_date_label(dates):
     """
     Determine appropriate date format based on date range.
@@ -274,7 +665,8 @@ def format_date_label(dates):
     return '%b %d'
 
 
-def _generate_kpi_chart(stat, player_name, game_name, game_installment, size, theme, game_mode=None, title_label="First Game Stats"):
+@_with_fig_lock
+def _generate_kpi_chart(stat, player_name, game_name, game_installment, size, theme, game_mode=None, title_label="First Game Stats", out=None):
     """
     Generate a KPI scoreboard visual for a single stat.
     Shows the abbreviated stat name in large text with the value as a huge
@@ -288,7 +680,7 @@ def _generate_kpi_chart(stat, player_name, game_name, game_installment, size, th
     _fill = 0.88
 
     if size == 'instagram':
-        fig, ax = plt.subplots(figsize=(10.8, 10.8), dpi=100)
+        fig, ax = _get_fig(size, 'kpi')
         fig_width_pts  = 10.8 * 72
         fig_height_pts = 10.8 * 72
         title_fontsize = max(36, min(int(fig_width_pts * _fill / (len(_line1) * _char_ratio)), 64))
@@ -299,7 +691,7 @@ def _generate_kpi_chart(stat, player_name, game_name, game_installment, size, th
         twitch_offset = 0.062
         handle_offset = 0.134
     else:  # twitter - 1600x900
-        fig, ax = plt.subplots(figsize=(16, 9), dpi=100)
+        fig, ax = _get_fig(size, 'kpi')
         fig_width_pts  = 16 * 72
         fig_height_pts = 9  * 72
         title_fontsize = max(36, min(int(fig_width_pts * _fill / (len(_line1) * _char_ratio)), 64))
@@ -382,69 +774,143 @@ def _generate_kpi_chart(stat, player_name, game_name, game_installment, size, th
             color=kpi_color, transform=ax.transAxes,
             zorder=1)
 
-    # Title (same structure as generate_bar_chart)
+    # Title (same structure as generate_bar_chart, without the glow/shadow)
     full_game_name = f"{game_name}: {game_installment}" if game_installment else game_name
-    y_position = 0.96
-    line_spacing = (title_fontsize / fig_height_pts) * 1.30
+    top_margin = _add_title(fig, f"{player_name}'s {title_label}", full_game_name, theme,
+                            title_fontsize, fig_height_pts, styled=False)
 
-    fig.text(0.5, y_position, f"{player_name}'s {title_label}", ha='center', va='top',
-             fontsize=title_fontsize, fontweight='bold', color='white',
-             transform=fig.transFigure)
-    y_position -= line_spacing
+    # Footer: branding, game mode tag, timestamp
+    _add_footer(fig, 0.03, branding_fontsize, (amp_offset, twitch_offset, handle_offset), game_mode)
 
-    fig.text(0.5, y_position, full_game_name, ha='center', va='top',
-             fontsize=title_fontsize, fontweight='bold', color='white',
-             transform=fig.transFigure)
-    y_position -= line_spacing
+    _fit_axes_in_rect(fig, ax, [0, 0.05, 1, top_margin])
 
-    if theme['show_in_title']:
-        theme_color = colors[2] if len(colors) > 2 else colors[0]
-        fig.text(0.5, y_position, theme['theme_name'], ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color=theme_color,
-                 transform=fig.transFigure)
+    return _write_png(fig, out)
 
-    # Timestamp
-    try:
-        timestamp = datetime.now(ZoneInfo(TIMEZONE_STR)).strftime('%B %d, %Y')
-    except Exception:
-        timestamp = datetime.now().strftime('%B %d, %Y')
-    fig.text(0.99, 0.03, timestamp, ha='right', va='bottom',
-             fontsize=branding_fontsize, color='gray', style='italic')
 
-    # Game mode tag (centered between handles and date)
-    _mode_tag = abbreviate_game_mode(game_mode) if game_mode else None
-    if _mode_tag:
-        fig.text(0.5, 0.03, f' {_mode_tag} ', ha='center', va='bottom',
-                 fontsize=branding_fontsize, color='white', fontweight='bold',
-                 bbox=dict(boxstyle='round,pad=0.3', facecolor='none', edgecolor='white', linewidth=1.5))
+# --- PILLOW FAST PATH ---
+_FONTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts')
 
-    # Multi-platform branding
-    handle = os.environ.get('TWITCH_HANDLE', 'TheBOLBroadcast')
-    x_start = 0.01
-    y_pos = 0.03
-    fig.text(x_start, y_pos, 'YT', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='#FF0000', fontweight='bold')
-    fig.text(x_start + amp_offset, y_pos, ' & ', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='white', fontweight='normal')
-    fig.text(x_start + twitch_offset, y_pos, 'Twitch', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='#9146FF', fontweight='bold')
-    fig.text(x_start + handle_offset, y_pos, f' : {handle}', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='white', fontweight='bold')
 
-    n_title_lines = 3 if theme['show_in_title'] else 2
-    top_margin = 0.96 - n_title_lines * line_spacing
-    plt.tight_layout(rect=[0, 0.05, 1, top_margin])
+@lru_cache(maxsize=32)
+def _pil_font(filename, size_px):
+    """Load (once) a bundled TTF at the given pixel size."""
+    return ImageFont.truetype(os.path.join(_FONTS_DIR, filename), size_px)
+
+
+def _fast_bar_chart(labels, values, player_name, game_name, game_installment, size, theme, game_mode=None, title_label="First Game Stats", out=None):
+    """
+    Draw a 2-3 stat horizontal bar chart directly with Pillow.
+
+    Skips matplotlib's artist tree entirely: background, rounded bars, value
+    labels, title and branding are rasterized straight onto one RGB canvas.
+    Only used for linear-scale charts (no log axis to draw) when
+    USE_FAST_RENDERER is set. The x-axis ticks/grid are omitted since every
+    bar carries its own value label. labels/values are in barh order
+    (largest last).
+
+    Returns:
+        BytesIO object containing PNG image
+    """
+    colors = theme['colors']
+    num_stats = len(values)
+    pt = 100 / 72  # matplotlib sizes are in points at dpi=100
+
+    line1 = f"{player_name}'s {title_label}"
+    if size == 'instagram':
+        W, H = 1080, 1080
+        title_fontsize = max(28, min(int(10.8 * 72 * 0.88 / (len(line1) * 0.60)), 48))
+        value_fontsize = 70 if num_stats == 3 else 80
+        branding_fontsize = 19
+        branding_y_pos = 0.06 if num_stats == 2 else 0.03
+    else:  # twitter - 1600x900
+        W, H = 1600, 900
+        title_fontsize = max(28, min(int(16 * 72 * 0.88 / (len(line1) * 0.60)), 52))
+        value_fontsize = 52 if num_stats == 3 else 64
+        branding_fontsize = 18
+        branding_y_pos = 0.05 if num_stats == 2 else 0.03
 
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight',
-                facecolor=fig.get_facecolor(), pad_inches=0.3)
-    buf.seek(0)
-    plt.close(fig)
+    img = Image.new('RGB', (W, H), '#1a1a1a')
+    draw = ImageDraw.Draw(img)
 
-    return buf
+    # Title block (same lines as generate_bar_chart)
+    title_font = _pil_font('FiraCode-Bold.ttf', round(title_fontsize * pt))
+    full_game_name = f"{game_name}: {game_installment}" if game_installment else game_name
+    title_lines = [(line1, 'white'), (full_game_name, 'white')]
+    if theme['show_in_title']:
+        title_lines.append((theme['theme_name'], colors[2] if len(colors) > 2 else colors[0]))
+    y = H * 0.04
+    line_spacing = title_fontsize * pt * 1.30
+    _is_gaming = (theme['theme_name'] == 'Gaming')
+    for i, (text, color) in enumerate(title_lines):
+        if i == 0 and _is_gaming:
+            draw.text((W / 2, y), text, font=title_font, fill=color, anchor='mt',
+                      stroke_width=3, stroke_fill=colors[0])
+        else:
+            if i == 0:
+                draw.text((W / 2 + W * 0.003, y + H * 0.003), text, font=title_font, fill='#0d0d0d', anchor='mt')
+            draw.text((W / 2, y), text, font=title_font, fill=color, anchor='mt')
+        y += line_spacing
+
+    # Plot area: below the title, above the branding row
+    label_font = _pil_font('FiraSansExtraCondensed-Regular.ttf', round(int(value_fontsize / 1.5) * pt))
+    value_font = _pil_font('FiraCode-Bold.ttf', round(value_fontsize * pt))
+    left = max(label_font.getlength(lbl) for lbl in labels) + W * 0.03
+    right = W * 0.97
+    top = y + H * 0.02
+    bottom = H * (1 - branding_y_pos) - branding_fontsize * pt * 2.5
+    draw.rectangle([left, top, right, bottom], fill='#2d2d2d')
+
+    plot_w = right - left
+    slot_h = (bottom - top) / num_stats
+    max_val = max(max(values), 1e-9) * 1.05  # matplotlib's default 5% axis margin
+    # Largest bar on top: barh order is bottom-to-top, so walk it reversed
+    for row, (label, value) in enumerate(zip(reversed(labels), reversed(values))):
+        color = colors[num_stats - 1 - row]
+        bar_w = plot_w * max(value, 0) / max_val
+        cy = top + slot_h * (row + 0.5)
+        bar_h = slot_h * 0.8
+        if bar_w >= 1:
+            draw.rounded_rectangle([left, cy - bar_h / 2, left + bar_w, cy + bar_h / 2],
+                                   radius=6, fill=color,
+                                   outline='white' if _is_gaming else None, width=1)
+        draw.text((left - W * 0.01, cy), label, font=label_font, fill='white', anchor='rm')
+        if bar_w > plot_w * 0.15:
+            x_pos, anchor = left + bar_w * 0.95, 'rm'
+        else:
+            x_pos, anchor = left + bar_w + plot_w * 0.02, 'lm'
+        draw.text((x_pos, cy), format_large_number(value), font=value_font, fill='white',
+                  anchor=anchor, stroke_width=3, stroke_fill='#111111')
+
+    # Footer: branding (left), game mode tag (center), timestamp (right)
+    footer_y = H * (1 - branding_y_pos)
+    bold_font = _pil_font('FiraCode-Bold.ttf', round(branding_fontsize * pt))
+    regular_font = _pil_font('FiraCode-Regular.ttf', round(branding_fontsize * pt))
+    x = W * 0.01
+    for text, color, font in (('YT', '#FF0000', bold_font), (' & ', 'white', regular_font),
+                              ('Twitch', '#9146FF', bold_font), (f' : {TWITCH_HANDLE}', 'white', bold_font)):
+        draw.text((x, footer_y), text, font=font, fill=color, anchor='ld')
+        x += font.getlength(text)
+
+    _mode_tag = abbreviate_game_mode(game_mode) if game_mode else None
+    if _mode_tag:
+        box = draw.textbbox((W / 2, footer_y), f' {_mode_tag} ', font=bold_font, anchor='md')
+        pad = branding_fontsize * pt * 0.3
+        draw.rounded_rectangle([box[0] - pad, box[1] - pad, box[2] + pad, box[3] + pad],
+                               radius=pad, outline='white', width=2)
+        draw.text((W / 2, footer_y), f' {_mode_tag} ', font=bold_font, fill='white', anchor='md')
 
+    draw.text((W * 0.99, footer_y), _timestamp_str(), font=_pil_font('FiraCode-Light.ttf', round(branding_fontsize * pt)),
+              fill='gray', anchor='rd')
 
-def generate_bar_chart(stat_data, player_name, game_name, game_installment=None, size='twitter', game_mode=None, tz=None, title_label="First Game Stats"):
+    data = _encode_png(np.asarray(img))
+    if out is None:
+        return io.BytesIO(data)
+    out.write(data)
+    return out
+
+
+@_with_fig_lock
+def generate_bar_chart(stat_data, player_name, game_name, game_installment=None, size='twitter', game_mode=None, tz=None, title_label="First Game Stats", out=None):
     """
     Generate a HORIZONTAL bar chart for first-time game stats.
     
@@ -464,58 +930,52 @@ def generate_bar_chart(stat_data, player_name, game_name, game_installment=None,
         game_name: str
         game_installment: str (optional)
         size: str ('twitter' = 1200x630, 'instagram' = 1080x1080)
+        out: optional writable binary stream to encode the PNG into directly
+             (e.g. an upload stream) instead of a new BytesIO
     
     Returns:
-        BytesIO object containing PNG image
+        BytesIO object containing PNG image (or `out`, when given)
     """
-    # Extract data from dict format
-    stats = []
-    for i in range(1, 4):
-        stat_key = f'stat{i}'
+    # Extract labels/values as parallel lists (abbreviated names for display)
+    labels = []
+    values = []
+    for i, stat_key in enumerate(_STAT_KEYS, 1):
         if stat_key in stat_data:
-            label = stat_data[stat_key].get('label', f'Stat {i}')
-            value = stat_data[stat_key].get('value', 0)
-            
-            # Abbreviate long stat names
-            abbrev_label = abbreviate_stat(label)
-            
-            stats.append({
-                'label': abbrev_label,
-                'original_label': label,
-                'value': value
-            })
-    
-    # SORT by value (largest to smallest)
-    stats.sort(key=lambda x: x['value'], reverse=True)
-    
-    # Extract sorted labels and values
-    labels = [s['label'] for s in stats]
-    values = [s['value'] for s in stats]
-    
-    # REVERSE for matplotlib (barh plots bottom-to-top, we want largest on top)
-    labels.reverse()
-    values.reverse()
-    
+            entry = stat_data[stat_key]
+            labels.append(abbreviate_stat(entry.get('label', f'Stat {i}')))
+            values.append(entry.get('value', 0))
+
+    # SORT by value, largest last: barh plots bottom-to-top and we want the
+    # largest on top. (Descending sort then reversed, so ties keep the same
+    # top-to-bottom order as the original stat order.)
+    order = sorted(range(len(values)), key=values.__getitem__, reverse=True)[::-1]
+    labels = [labels[i] for i in order]
+    values = [values[i] for i in order]
+
     # Count stats, get theme early, and branch for single-stat KPI visual
-    num_stats = len(stats)
-    theme = get_themed_colors(tz)
+    num_stats = len(values)
+    theme = _cached_theme(tz)
     colors = theme['colors']
     _is_gaming = (theme['theme_name'] == 'Gaming')
 
     if num_stats == 1:
-        return _generate_kpi_chart(stats[0], player_name, game_name, game_installment, size, theme, game_mode=game_mode, title_label=title_label)
+        return _generate_kpi_chart({'label': labels[0], 'value': values[0]}, player_name, game_name, game_installment, size, theme, game_mode=game_mode, title_label=title_label, out=out)
 
     # Determine if we should use log scale
     use_log = should_use_log_scale(values)
 
+    if USE_FAST_RENDERER and not use_log:
+        return _fast_bar_chart(labels, values, player_name, game_name, game_installment, size, theme,
+                               game_mode=game_mode, title_label=title_label, out=out)
+
     # Pre-compute title line for dynamic font sizing (used in both size branches)
     _line1_preview = f"{player_name}'s {title_label}"
     _char_ratio = 0.60
     _fill = 0.88
 
-    # Fixed canvas sizes; bar area is controlled via tight_layout rect below
+    # Fixed canvas sizes; bar area is controlled via the layout rect below
     if size == 'instagram':
-        fig, ax = plt.subplots(figsize=(10.8, 10.8), dpi=100)
+        fig, ax = _get_fig(size, 'bar')
         fig_width_pts  = 10.8 * 72   # 777.6 pt
         fig_height_pts = 10.8 * 72   # 777.6 pt
         # Dynamic title: fills width up to a readable cap
@@ -529,7 +989,7 @@ def generate_bar_chart(stat_data, player_name, game_name, game_installment=None,
         handle_offset = 0.134
         branding_y_pos = 0.06 if num_stats == 2 else 0.03
     else:  # twitter - 1600x900
-        fig, ax = plt.subplots(figsize=(16, 9), dpi=100)
+        fig, ax = _get_fig(size, 'bar')
         fig_width_pts  = 16 * 72     # 1152 pt
         fig_height_pts = 9  * 72     # 648 pt
         # Dynamic title: wider canvas allows larger text, height-capped lower
@@ -571,33 +1031,11 @@ def generate_bar_chart(stat_data, player_name, game_name, game_installment=None,
     # Apply log scale before label positioning so xlim reflects the log axis range
     if use_log:
         ax.set_xscale('log')
-        from matplotlib.ticker import FuncFormatter, LogLocator
-        def log_formatter(x, pos):
-            """Format log scale labels to show actual values"""
-            if x >= 1000:
-                return f'{int(x/1000)}k'
-            elif x >= 1:
-                return f'{int(x)}'
-            else:
-                return f'{x:.1f}'
-        ax.xaxis.set_major_formatter(FuncFormatter(log_formatter))
         # Set xlim_max to a "nice" number above max_val so the axis extends past the data
-        max_val = max(plot_values)
-        import math
-        magnitude = 10 ** math.floor(math.log10(max_val * 1.1))
-        normalized = (max_val * 1.1) / magnitude
-        if normalized <= 1:
-            nice_max = 1 * magnitude
-        elif normalized <= 2:
-            nice_max = 2 * magnitude
-        elif normalized <= 5:
-            nice_max = 5 * magnitude
-        else:
-            nice_max = 10 * magnitude
-        ax.set_xlim(left=ax.get_xlim()[0], right=nice_max)
+        ax.set_xlim(left=ax.get_xlim()[0], right=_nice_log_max(max(plot_values)))
         # Add intermediate ticks (1, 2, 5 × 10^n) so labels like 2k, 5k appear
         ax.xaxis.set_major_locator(LogLocator(base=10, subs=[1, 2, 5]))
-        ax.xaxis.set_major_formatter(FuncFormatter(log_formatter))
+        ax.xaxis.set_major_formatter(FuncFormatter(_log_formatter))
 
     # Add value labels - position depends on bar size relative to axis range
     _, xlim_max = ax.get_xlim()
@@ -608,10 +1046,9 @@ def generate_bar_chart(stat_data, player_name, game_name, game_installment=None,
         if use_log:
             # Check bar visual fraction — short bars can't fit the label inside
             xlim_min_val, _ = ax.get_xlim()
-            import math as _math
-            log_min = _math.log10(max(xlim_min_val, 0.01))
-            log_max = _math.log10(xlim_max)
-            log_bar_end = _math.log10(max(width, 0.01))
+            log_min = math.log10(max(xlim_min_val, 0.01))
+            log_max = math.log10(xlim_max)
+            log_bar_end = math.log10(max(width, 0.01))
             bar_vis_frac = (log_bar_end - log_min) / (log_max - log_min)
             if bar_vis_frac < 0.12:
                 # Bar too short — place label just outside to the right
@@ -650,42 +1087,10 @@ def generate_bar_chart(stat_data, player_name, game_name, game_installment=None,
     # capped at 20pt so they don't compete with bar labels on phone screens.
     ax.tick_params(axis='x', labelsize=max(12, min(int(value_fontsize * 0.45), 20)))
 
-    # MANUAL TITLE with two-tone coloring
+    # MANUAL TITLE with two-tone coloring: "{Player}'s {title_label}" / "Game: Installment"
     full_game_name = f"{game_name}: {game_installment}" if game_installment else game_name
-
-    # Build title manually with fig.text for proper positioning
-    y_position = 0.96  # Start near top
-    # Line spacing proportional to font height in figure-fraction coordinates
-    line_spacing = (title_fontsize / fig_height_pts) * 1.30
-
-    # Line 1: "{Player}'s {title_label}" - WHITE
-    line1 = f"{player_name}'s {title_label}"
-    if _is_gaming:
-        fig.text(0.5, y_position, line1, ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color='white',
-                 transform=fig.transFigure,
-                 path_effects=[pe.withStroke(linewidth=4, foreground=colors[0])])
-    else:
-        fig.text(0.503, y_position - 0.003, line1, ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color='#000000',
-                 alpha=0.45, transform=fig.transFigure)
-        fig.text(0.5, y_position, line1, ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color='white',
-                 transform=fig.transFigure)
-    y_position -= line_spacing
-
-    # Line 2: "Game: Installment" - WHITE
-    fig.text(0.5, y_position, full_game_name, ha='center', va='top',
-             fontsize=title_fontsize, fontweight='bold', color='white',
-             transform=fig.transFigure)
-    y_position -= line_spacing
-
-    # Line 3 (OPTIONAL): Heritage month/holiday name - THIRD COLOR
-    if theme['show_in_title']:
-        theme_color = colors[2] if len(colors) > 2 else colors[0]
-        fig.text(0.5, y_position, theme['theme_name'], ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color=theme_color,
-                 transform=fig.transFigure)
+    top_margin = _add_title(fig, f"{player_name}'s {title_label}", full_game_name, theme,
+                            title_fontsize, fig_height_pts)
 
     # REMOVED axis labels (self-explanatory)
     # ax.set_xlabel('Value', fontsize=label_fontsize, fontweight='bold')
@@ -701,66 +1106,25 @@ def generate_bar_chart(stat_data, player_name, game_name, game_installment=None,
     ax.spines['left'].set_color('white')
     ax.spines['bottom'].set_color('white')
 
-    # Add timestamp
-    try:
-        timestamp = datetime.now(ZoneInfo(TIMEZONE_STR)).strftime('%B %d, %Y')
-    except Exception:
-        timestamp = datetime.now().strftime('%B %d, %Y')
-    fig.text(0.99, branding_y_pos, timestamp, ha='right', va='bottom',
-             fontsize=branding_fontsize, color='gray', style='italic')
-
-    # Game mode tag (centered between handles and date)
-    _mode_tag = abbreviate_game_mode(game_mode) if game_mode else None
-    if _mode_tag:
-        fig.text(0.5, branding_y_pos, f' {_mode_tag} ', ha='center', va='bottom',
-                 fontsize=branding_fontsize, color='white', fontweight='bold',
-                 bbox=dict(boxstyle='round,pad=0.3', facecolor='none', edgecolor='white', linewidth=1.5))
-
-    # Add multi-platform branding
-    handle = os.environ.get('TWITCH_HANDLE', 'TheBOLBroadcast')
-    x_start = 0.01
-
-    # "YT" in red
-    fig.text(x_start, branding_y_pos, 'YT', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='#FF0000', fontweight='bold')
-
-    # " & " in white
-    fig.text(x_start + amp_offset, branding_y_pos, ' & ', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='white', fontweight='normal')
-
-    # "Twitch" in purple
-    fig.text(x_start + twitch_offset, branding_y_pos, 'Twitch', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='#9146FF', fontweight='bold')
-
-    # Handle in white
-    fig.text(x_start + handle_offset, branding_y_pos, f' : {handle}', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='white', fontweight='bold')
-
-    # Compute top margin dynamically: 2 title lines normally, 3 with holiday theme
-    n_title_lines = 3 if theme['show_in_title'] else 2
-    top_margin = 0.96 - n_title_lines * line_spacing
+    # Footer: branding, game mode tag, timestamp
+    _add_footer(fig, branding_y_pos, branding_fontsize, (amp_offset, twitch_offset, handle_offset), game_mode)
 
     # 2-stat: use a centered, slightly smaller rect so bars don't dominate the canvas.
     # 3-stat: use full dynamic top_margin to fill available space.
     if num_stats == 2:
         if size == 'instagram':
-            plt.tight_layout(rect=[0, 0.15, 1, 0.72])
+            _fit_axes_in_rect(fig, ax, [0, 0.15, 1, 0.72])
         else:  # twitter
-            plt.tight_layout(rect=[0, 0.12, 1, 0.75])
+            _fit_axes_in_rect(fig, ax, [0, 0.12, 1, 0.75])
     else:
-        plt.tight_layout(rect=[0, 0.05, 1, top_margin])
+        _fit_axes_in_rect(fig, ax, [0, 0.05, 1, top_margin])
 
-    # Save to bytes
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=100, bbox_inches='tight',
-                facecolor=fig.get_facecolor(), pad_inches=0.3)
-    buf.seek(0)
-    plt.close(fig)
+    # Save to bytes — fixed canvas size (no bbox_inches='tight' re-render/crop)
+    return _write_png(fig, out)
 
-    return buf
 
-
-def generate_line_chart(stat_history, player_name, game_name, game_installment=None, size='twitter', game_mode=None, tz=None):
+@_with_fig_lock
+def generate_line_chart(stat_history, player_name, game_name, game_installment=None, size='twitter', game_mode=None, tz=None, out=None):
     """
     Generate a line chart showing stat trends over time.
     
@@ -769,6 +1133,7 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     - Abbreviated stat names
     - Log scale for skewed data
     - FIXED: Reduced height and improved bottom spacing to prevent overlap
+    - Single session: falls back to a "Latest Game Stats" bar chart
     
     Args:
         stat_history: dict with 'dates' and 'stat1'/'stat2'/'stat3' keys
@@ -776,25 +1141,37 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
         game_name: name of the game
         game_installment: optional game installment/version
         size: 'twitter' (1600x900) or 'instagram' (1080x1080)
+        out: optional writable binary stream to encode the PNG into directly
+             (e.g. an upload stream) instead of a new BytesIO
     
     Returns:
-        BytesIO buffer containing the chart image
+        BytesIO buffer containing the chart image (or `out`, when given)
     """
     dates = stat_history.get('dates', [])
 
     if not dates:
         raise ValueError("No dates provided in stat_history")
 
+    # One session can't show a trend — draw its values as a bar chart instead
+    # (same fallback the social pipeline uses for thin histories)
+    if len(dates) < 2:
+        stat_data = {}
+        for i, stat_key in enumerate(_STAT_KEYS, 1):
+            entry = stat_history.get(stat_key)
+            if entry and entry.get('values'):
+                stat_data[stat_key] = {'label': entry.get('label', f'Stat {i}'), 'value': entry['values'][-1]}
+        if stat_data:
+            print("ℹ️ Only one session in history — drawing a bar chart instead")
+            return generate_bar_chart(stat_data, player_name, game_name, game_installment, size=size,
+                                      game_mode=game_mode, tz=tz, title_label="Latest Game Stats", out=out)
+
     # Get themed colors
-    theme = get_themed_colors(tz)
+    theme = _cached_theme(tz)
     colors = theme['colors']
     _is_gaming = (theme['theme_name'] == 'Gaming')
 
     # Count active stats for font sizing
-    num_stats = sum(
-        1 for i in range(1, 4)
-        if f'stat{i}' in stat_history and stat_history[f'stat{i}']
-    )
+    num_stats = sum(1 for stat_key in _STAT_KEYS if stat_history.get(stat_key))
 
     # Pre-compute title line for dynamic font sizing
     _line1_preview = f"{player_name}'s Performance Over Time"
@@ -803,7 +1180,7 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
 
     # Fixed canvas sizes matching generate_bar_chart
     if size == 'instagram':
-        fig, ax = plt.subplots(figsize=(10.8, 10.8), dpi=100)
+        fig, ax = _get_fig(size, 'line')
         fig_width_pts  = 10.8 * 72
         fig_height_pts = 10.8 * 72
         title_fontsize = max(28, min(int(fig_width_pts * _fill / (len(_line1_preview) * _char_ratio)), 48))
@@ -815,7 +1192,7 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
         handle_offset = 0.127
         branding_y_pos = 0.03
     else:  # twitter - 1600x900
-        fig, ax = plt.subplots(figsize=(16, 9), dpi=100)
+        fig, ax = _get_fig(size, 'line')
         fig_width_pts  = 16 * 72
         fig_height_pts = 9 * 72
         title_fontsize = max(28, min(int(fig_width_pts * _fill / (len(_line1_preview) * _char_ratio)), 52))
@@ -832,23 +1209,20 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     # Store line end positions for direct labeling
     line_end_positions = []
     
-    # Collect all values to check if we need log scale
-    all_values = []
-    for i in range(1, 4):
-        stat_key = f'stat{i}'
-        if stat_key in stat_history and stat_history[stat_key]:
-            values = stat_history[stat_key].get('values', [])
-            all_values.extend(values)
+    # Collect all values (as one float array) to check if we need log scale
+    series_arrays = [np.asarray(stat_history[stat_key].get('values', []), dtype=np.float64)
+                     for stat_key in _STAT_KEYS if stat_history.get(stat_key)]
+    all_values = np.concatenate(series_arrays) if series_arrays else np.empty(0)
     
     # Determine if we should use log scale
-    use_log = should_use_log_scale(all_values) if all_values else False
+    use_log = should_use_log_scale(all_values)
     
     # Plot each stat
-    for i in range(1, 4):
-        stat_key = f'stat{i}'
-        if stat_key in stat_history and stat_history[stat_key]:
-            label = stat_history[stat_key].get('label', f'Stat {i}')
-            values = stat_history[stat_key].get('values', [])
+    for i, stat_key in enumerate(_STAT_KEYS, 1):
+        entry = stat_history.get(stat_key)
+        if entry:
+            label = entry.get('label', f'Stat {i}')
+            values = entry.get('values', [])
             
             # Abbreviate stat name
             abbrev_label = abbreviate_stat(label)
@@ -890,33 +1264,11 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     # Set log scale if needed
     if use_log:
         ax.set_yscale('log')
-        from matplotlib.ticker import FuncFormatter, LogLocator
-        import math
-        def log_formatter(x, pos):
-            """Format log scale labels to show actual values"""
-            if x >= 1000:
-                return f'{int(x/1000)}k'
-            elif x >= 1:
-                return f'{int(x)}'
-            else:
-                return f'{x:.1f}'
-        ax.yaxis.set_major_formatter(FuncFormatter(log_formatter))
         # Extend y-axis to a nice number above the data max so the axis shows all values
-        max_val = max(all_values)
-        magnitude = 10 ** math.floor(math.log10(max_val * 1.1))
-        normalized = (max_val * 1.1) / magnitude
-        if normalized <= 1:
-            nice_max = 1 * magnitude
-        elif normalized <= 2:
-            nice_max = 2 * magnitude
-        elif normalized <= 5:
-            nice_max = 5 * magnitude
-        else:
-            nice_max = 10 * magnitude
-        ax.set_ylim(top=nice_max)
+        ax.set_ylim(top=_nice_log_max(all_values.max()))
         # Add intermediate ticks (1, 2, 5 × 10^n) so labels like 2k, 5k appear
         ax.yaxis.set_major_locator(LogLocator(base=10, subs=[1, 2, 5]))
-        ax.yaxis.set_major_formatter(FuncFormatter(log_formatter))
+        ax.yaxis.set_major_formatter(FuncFormatter(_log_formatter))
     
     # # Styling
     # full_game_name = f"{game_name}: {game_installment}" if game_installment else game_name
@@ -926,42 +1278,10 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     # if theme['show_in_title']:
     #     title_text += f"\n{theme['theme_name']}"
         
-    # MANUAL TITLE with two-tone coloring
+    # MANUAL TITLE with two-tone coloring: "{Player}'s Performance Over Time" / "Game: Installment"
     full_game_name = f"{game_name}: {game_installment}" if game_installment else game_name
-    
-    # Build title manually with fig.text for proper positioning
-    y_position = 0.96  # Start near top
-    # Line spacing proportional to font height in figure-fraction coordinates
-    line_spacing = (title_fontsize / fig_height_pts) * 1.30
-
-    # Line 1: "{Player}'s  Performance Over Time" - WHITE
-    line1 = f"{player_name}'s Performance Over Time"
-    if _is_gaming:
-        fig.text(0.5, y_position, line1, ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color='white',
-                 transform=fig.transFigure,
-                 path_effects=[pe.withStroke(linewidth=4, foreground=colors[0])])
-    else:
-        fig.text(0.503, y_position - 0.003, line1, ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color='#000000',
-                 alpha=0.45, transform=fig.transFigure)
-        fig.text(0.5, y_position, line1, ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color='white',
-                 transform=fig.transFigure)
-    y_position -= line_spacing
-
-    # Line 2: "Game: Installment" - WHITE
-    fig.text(0.5, y_position, full_game_name, ha='center', va='top',
-             fontsize=title_fontsize, fontweight='bold', color='white',
-             transform=fig.transFigure)
-    y_position -= line_spacing
-
-    # Line 3 (OPTIONAL): Heritage month/holiday name - THIRD COLOR
-    if theme['show_in_title']:
-        theme_color = colors[2] if len(colors) > 2 else colors[0]
-        fig.text(0.5, y_position, theme['theme_name'], ha='center', va='top',
-                 fontsize=title_fontsize, fontweight='bold', color=theme_color,
-                 transform=fig.transFigure)
+    top_margin = _add_title(fig, f"{player_name}'s Performance Over Time", full_game_name, theme,
+                            title_fontsize, fig_height_pts)
     
     # ax.set_title(title_text, fontsize=title_fontsize, fontweight='bold', color='white', pad=20)
     
@@ -972,11 +1292,10 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     # Format x-axis dates with year if needed
     date_format = format_date_label(dates)
     # One tick per calendar day; interval scales so we never show more than ~8 labels.
-    import math as _math
     import datetime as _dt
     _day_set = {d.date() if hasattr(d, 'date') else d for d in dates}
     unique_days = len(_day_set)
-    day_interval = max(1, _math.ceil(unique_days / 8))
+    day_interval = max(1, math.ceil(unique_days / 8))
     ax.xaxis.set_major_locator(mdates.DayLocator(interval=day_interval))
     ax.xaxis.set_major_formatter(mdates.DateFormatter(date_format))
     # Expand xlim to midnight-to-midnight so DayLocator ticks land inside the visible range.
@@ -993,12 +1312,13 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     _tick_count = max(unique_days // day_interval, 1)
     _space_per_date = _axis_w_pts / _tick_count
     date_fontsize = max(12, min(int(_space_per_date / 3.5), 20))
-    plt.setp(ax.xaxis.get_majorticklabels(), rotation=35, ha='right', fontsize=date_fontsize)
+    setp(ax.xaxis.get_majorticklabels(), rotation=35, ha='right', fontsize=date_fontsize)
     
     # Add direct labels at end of lines (instead of legend)
     if line_end_positions:
-        # Sort by y-position (ascending) so we can detect and resolve overlaps
-        line_end_positions.sort(key=lambda x: x['y'])
+        # Sort by y-position (ascending) so we can detect and resolve overlaps —
+        # the spread loop below only compares neighbours, so this order matters
+        line_end_positions.sort(key=itemgetter('y'))
 
         ymin, ymax = ax.get_ylim()
         ax_height_pts = fig.get_size_inches()[1] * 72 * ax.get_position().height
@@ -1009,7 +1329,6 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
         # but are visually close on a log scale).  Convert to log10 space first
         # so the gap calculation matches what is actually rendered on screen.
         if use_log:
-            import math
             _to_screen = lambda v: math.log10(max(v, 1e-10))
             log_min = _to_screen(max(ymin, 1e-10))
             log_max = _to_screen(max(ymax, 1e-10))
@@ -1083,44 +1402,8 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     # Snap x-axis to data range — no padding so line fills full width
     ax.set_xlim(dates[0], dates[-1])
 
-    # Add timestamp
-    try:
-        timestamp = datetime.now(ZoneInfo(TIMEZONE_STR)).strftime('%B %d, %Y')
-    except Exception:
-        timestamp = datetime.now().strftime('%B %d, %Y')
-    fig.text(0.99, branding_y_pos, timestamp, ha='right', va='bottom',
-             fontsize=branding_fontsize, color='gray', style='italic')
-
-    # Game mode tag (centered between handles and date)
-    _mode_tag = abbreviate_game_mode(game_mode) if game_mode else None
-    if _mode_tag:
-        fig.text(0.5, branding_y_pos, f' {_mode_tag} ', ha='center', va='bottom',
-                 fontsize=branding_fontsize, color='white', fontweight='bold',
-                 bbox=dict(boxstyle='round,pad=0.3', facecolor='none', edgecolor='white', linewidth=1.5))
-
-    # Add multi-platform branding
-    handle = os.environ.get('TWITCH_HANDLE', 'TheBOLBroadcast')
-    x_start = 0.01
-
-    # "YT" in red
-    fig.text(x_start, branding_y_pos, 'YT', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='#FF0000', fontweight='bold')
-
-    # " & " in white
-    fig.text(x_start + amp_offset, branding_y_pos, ' & ', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='white', fontweight='normal')
-
-    # "Twitch" in purple
-    fig.text(x_start + twitch_offset, branding_y_pos, 'Twitch', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='#9146FF', fontweight='bold')
-
-    # Handle in white
-    fig.text(x_start + handle_offset, branding_y_pos, f' : {handle}', ha='left', va='bottom',
-             fontsize=branding_fontsize, color='white', fontweight='bold')
-
-    # Compute top margin dynamically: 2 title lines normally, 3 with holiday theme
-    n_title_lines = 3 if theme['show_in_title'] else 2
-    top_margin = 0.96 - n_title_lines * line_spacing
+    # Footer: branding, game mode tag, timestamp
+    _add_footer(fig, branding_y_pos, branding_fontsize, (amp_offset, twitch_offset, handle_offset), game_mode)
 
     # Dynamic right boundary: measure longest label text and reserve exactly
     # enough figure-fraction for it (char width + bbox pad + 10pt offset).
@@ -1132,17 +1415,123 @@ def generate_line_chart(stat_history, player_name, game_name, game_installment=N
     #   Top band   : title text (fig.text, y > top_margin)
     #   Middle band: axes — full bleed left, right = dynamic label margin
     #   Bottom band: branding text (fig.text, y < 0.18)
-    plt.subplots_adjust(left=0, right=_right, bottom=0.18, top=top_margin)
+    fig.subplots_adjust(left=0, right=_right, bottom=0.18, top=top_margin)
 
     # Save to bytes — fixed canvas size, no bbox expansion so title stays centered
-    buf = io.BytesIO()
-    plt.savefig(buf, format='png', dpi=100,
-                facecolor=fig.get_facecolor(), pad_inches=0)
-    buf.seek(0)
-    plt.close(fig)
+    return _write_png(fig, out)
+
+
+# --- RENDER WORKER POOL ---
+# Rasterizing holds the GIL, so charts rendered from threads run one at a time
+# (and _FIG_LOCK serializes them anyway). The *_async generators and
+# generate_chart_variants hand the work to a small pool of worker processes, each with its own matplotlib state and
+# figure cache, so several charts render in parallel while the caller carries
+# on (e.g. with the next DB query). Workers are spawned lazily on first use.
+# Opt-in: each worker is a full matplotlib process (~80 MB RSS) and
+# os.cpu_count() sees the host's cores, not the container's quota, so the
+# default 0 renders serially in-process. Enable it on hosts with spare cores
+# and memory.
+def _env_int(name, default):
+    """int(os.environ[name]), or default when the variable is unset, empty or not a number."""
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        print(f"⚠️ Ignoring invalid {name}={raw!r}, using {default}")
+        return default
+
+
+CHART_WORKERS = max(0, _env_int("CHART_WORKERS", 0))
+
+_POOL = None
+_POOL_UNAVAILABLE = False
+_POOL_LOCK = threading.Lock()
+
+
+def _init_chart_worker():
+    """Warm a fresh worker: build both canvases and draw once so fonts are cached."""
+    for size in ('twitter', 'instagram'):
+        fig, _ = _get_fig(size, 'bar')
+        fig.canvas.draw()
+
+
+def _get_pool():
+    """Return the shared render pool, or None if worker processes are unavailable."""
+    global _POOL, _POOL_UNAVAILABLE
+    with _POOL_LOCK:
+        if _POOL is None and CHART_WORKERS > 0 and not _POOL_UNAVAILABLE:
+            try:
+                # spawn, not fork: the API process has live threads and an event loop
+                _POOL = ProcessPoolExecutor(max_workers=CHART_WORKERS,
+                                            mp_context=multiprocessing.get_context('spawn'),
+                                            initializer=_init_chart_worker)
+            except (OSError, NotImplementedError) as e:
+                # e.g. AWS Lambda has no /dev/shm for multiprocessing semaphores
+                print(f"⚠️ Chart worker pool unavailable, rendering in-process: {e}")
+                _POOL_UNAVAILABLE = True
+        return _POOL
+
+
+def _reset_pool(broken):
+    """Discard a pool whose worker died (OOM kill, segfault) so the next submit spawns a fresh one."""
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is broken:
+            _POOL = None
+            broken.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(func, *args, **kwargs):
+    """Run func in the render pool; falls back to an already-resolved Future in-process."""
+    for _attempt in range(2):
+        pool = _get_pool()
+        if pool is None:
+            break
+        try:
+            return pool.submit(func, *args, **kwargs)
+        except (BrokenProcessPool, OSError) as e:
+            # A dead worker poisons the whole executor (and a failed spawn, e.g.
+            # ENOMEM, leaves it half-started) — replace it and retry once
+            print(f"⚠️ Chart worker pool broken, restarting it: {e}")
+            _reset_pool(pool)
+    future = Future()
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as e:
+        future.set_exception(e)
+    return future
+
+
+def generate_bar_chart_async(*args, **kwargs):
+    """Same arguments as generate_bar_chart (except out); returns a Future resolving to the PNG BytesIO."""
+    return _submit(generate_bar_chart, *args, **kwargs)
 
 
-    return buf
+def generate_line_chart_async(*args, **kwargs):
+    """Same arguments as generate_line_chart (except out); returns a Future resolving to the PNG BytesIO."""
+    return _submit(generate_line_chart, *args, **kwargs)
+
+
+def generate_chart_variants(generator, *args, sizes=('twitter', 'instagram'), **kwargs):
+    """
+    Render one chart at several sizes concurrently in the render pool.
+
+    generator is generate_bar_chart or generate_line_chart; args/kwargs are
+    its arguments minus size (and out). Returns {size: PNG BytesIO}.
+    """
+    futures = {size: _submit(generator, *args, size=size, **kwargs) for size in sizes}
+    results = {}
+    for size, future in futures.items():
+        try:
+            results[size] = future.result()
+        except BrokenProcessPool as e:
+            # Worker died mid-render (e.g. OOM kill) — render this one serially;
+            # the next _submit replaces the broken pool.
+            print(f"⚠️ Chart worker died rendering {size}, rendering in-process: {e}")
+            results[size] = generator(*args, size=size, **kwargs)
+    return results
 
 
 def get_stat_history_from_db(cur, player_id, game_id, top_stat_types, timezone_str='UTC', days_back=365):
@@ -1166,7 +1555,7 @@ def get_stat_history_from_db(cur, player_id, game_id, top_stat_types, timezone_s
     # Single batched query: all stat types × all dates in one round-trip.
     # Previously this was a nested loop that fired up to (dates × stat_types)
     # individual queries — up to 1,095 queries for 365 days × 3 stats.
-    placeholders = ','.join(['%s'] * len(top_stat_types[:3]))
+    stat_types = list(top_stat_types[:3])
 
     # Use a window function to get the most recently submitted value per (date, stat_type).
     # MAX would show the highest value from all matches on a given day, which doesn't
@@ -1176,50 +1565,50 @@ def get_stat_history_from_db(cur, player_id, game_id, top_stat_types, timezone_s
     # Multiple stat types within the same session share the same played_at, so the
     # seen_dates deduplication below groups them into one x position automatically.
     # Same-day sessions become separate dots rather than collapsing to one per day.
+    # stat_type = ANY(%s) takes the list as a single array parameter, so the SQL
+    # text is identical regardless of how many stat types are requested.
+    # stat_value is INTEGER; COALESCE maps NULLs to 0 in SQL so rows arrive as
+    # plain ints that go straight into the int64 array below.
+    params = [timezone_str, player_id, game_id, stat_types]
+    window_clause = ""
     if days_back is not None:
-        cur.execute(f"""
-            SELECT (played_at AT TIME ZONE %s) AS play_ts, stat_type, stat_value
-            FROM fact.fact_game_stats
-            WHERE player_id = %s
-              AND game_id = %s
-              AND stat_type IN ({placeholders})
-              AND played_at >= NOW() - (%s || ' days')::INTERVAL
-            ORDER BY play_ts;
-        """, (timezone_str, player_id, game_id, *top_stat_types[:3], days_back))
-    else:
-        cur.execute(f"""
-            SELECT (played_at AT TIME ZONE %s) AS play_ts, stat_type, stat_value
-            FROM fact.fact_game_stats
-            WHERE player_id = %s
-              AND game_id = %s
-              AND stat_type IN ({placeholders})
-            ORDER BY play_ts;
-        """, (timezone_str, player_id, game_id, *top_stat_types[:3]))
-
-    # Pivot results into the expected stat_history structure
-    stat_values_map = {st: {} for st in top_stat_types[:3]}
-    dates_ordered = []
-    seen_dates = set()
-
-    for row in cur.fetchall():
-        play_ts, stat_type, best_value = row
-        if play_ts not in seen_dates:
-            seen_dates.add(play_ts)
-            dates_ordered.append(play_ts)
-        if stat_type in stat_values_map:
-            stat_values_map[stat_type][play_ts] = int(float(best_value)) if best_value is not None else 0
+        window_clause = "AND played_at >= NOW() - (%s || ' days')::INTERVAL"
+        params.append(days_back)
+
+    cur.execute(f"""
+        SELECT (played_at AT TIME ZONE %s) AS play_ts, stat_type,
+               COALESCE(stat_value, 0) AS stat_value
+        FROM fact.fact_game_stats
+        WHERE player_id = %s
+          AND game_id = %s
+          AND stat_type = ANY(%s)
+          {window_clause}
+        ORDER BY play_ts;
+    """, tuple(params))
+
+    # Pivot results into a (session × stat) array in one pass; sessions missing
+    # a stat stay 0. Later rows for the same cell overwrite earlier ones.
+    rows = cur.fetchall()
+    date_to_idx = {}
+    for row in rows:
+        date_to_idx.setdefault(row[0], len(date_to_idx))
+    dates_ordered = list(date_to_idx)
 
     stat_history['dates'] = dates_ordered
 
     if not dates_ordered:
         return stat_history
 
-    for i, stat_type in enumerate(top_stat_types[:3], 1):
-        stat_key = f'stat{i}'
+    stat_to_idx = {st: i for i, st in enumerate(dict.fromkeys(stat_types))}
+    arr = np.zeros((len(dates_ordered), len(stat_to_idx)), dtype=np.int64)
+    for play_ts, stat_type, stat_value in rows:
+        col = stat_to_idx.get(stat_type)
+        if col is not None:
+            arr[date_to_idx[play_ts], col] = stat_value
+
+    for stat_key, stat_type in zip(_STAT_KEYS, stat_types):
         stat_history[stat_key]['label'] = stat_type
-        stat_history[stat_key]['values'] = [
-            stat_values_map[stat_type].get(ts, 0) for ts in dates_ordered
-        ]
+        stat_history[stat_key]['values'] = arr[:, stat_to_idx[stat_type]].tolist()
 
     return stat_history
 
@@ -1248,18 +1637,17 @@ def generate_interactive_chart(chart_type, data, player_name, game_name,
     bg_color = "#111111"
     grid_color = "#2a2a2a"
     text_color = "#e0e0e0"
-    theme = get_themed_colors(tz)
+    theme = _cached_theme(tz)
     accent_colors = theme['colors']  # Dynamically matches holiday_themes.py
 
     fig = go.Figure()
 
     if chart_type == 'bar':
         labels, values = [], []
-        for i in range(1, 4):
-            key = f'stat{i}'
-            if key not in data or not data[key]:
+        for key in _STAT_KEYS:
+            stat = data.get(key)
+            if not stat:
                 continue
-            stat = data[key]
             labels.append(stat.get('label', key))
             values.append(stat.get('value', 0))
 
@@ -1300,17 +1688,15 @@ def generate_interactive_chart(chart_type, data, player_name, game_name,
                         for d in dates]
 
         all_line_values = []
-        for i in range(1, 4):
-            key = f'stat{i}'
-            if key in data and data[key]:
+        for key in _STAT_KEYS:
+            if data.get(key):
                 all_line_values.extend(data[key].get('values', []))
         use_log = should_use_log_scale(all_line_values) if all_line_values else False
 
-        for i, color in enumerate(accent_colors, 1):
-            key = f'stat{i}'
-            if key not in data or not data[key]:
+        for key, color in zip(_STAT_KEYS, accent_colors):
+            series = data.get(key)
+            if not series:
                 continue
-            series = data[key]
             label = series.get('label', key)
             vals = series.get('values', [])
             if not any(v for v in vals):
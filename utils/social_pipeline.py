@@ -52,6 +52,7 @@ def run_social_media_pipeline(
     from utils.chart_utils import (
         generate_bar_chart,
         generate_line_chart,
+        generate_chart_variants,
         get_stat_history_from_db,
         generate_interactive_chart,
     )
@@ -112,8 +113,8 @@ def run_social_media_pipeline(
 
         if games_played == 1:
             stat_data = _build_bar_data()
-            buf_tw = generate_bar_chart(stat_data, player_name, game_name, game_installment, size="twitter",   game_mode=batch_game_mode)
-            buf_ig = generate_bar_chart(stat_data, player_name, game_name, game_installment, size="instagram", game_mode=batch_game_mode)
+            bufs = generate_chart_variants(generate_bar_chart, stat_data, player_name, game_name, game_installment, game_mode=batch_game_mode)
+            buf_tw, buf_ig = bufs["twitter"], bufs["instagram"]
             chart_type = "bar"
             stat_data_for_caption = stat_data
             interactive_data = stat_data
@@ -133,14 +134,14 @@ def run_social_media_pipeline(
             if len(stat_history.get('dates', [])) < 2:
                 print(f"⚠️  [bg] Only {len(stat_history.get('dates', []))} session(s) in last 30 days for {player_name} / {game_name} — falling back to bar chart.")
                 stat_data = _build_bar_data()
-                buf_tw = generate_bar_chart(stat_data, player_name, game_name, game_installment, size="twitter",   game_mode=batch_game_mode, title_label="Latest Game Stats")
-                buf_ig = generate_bar_chart(stat_data, player_name, game_name, game_installment, size="instagram", game_mode=batch_game_mode, title_label="Latest Game Stats")
+                bufs = generate_chart_variants(generate_bar_chart, stat_data, player_name, game_name, game_installment, game_mode=batch_game_mode, title_label="Latest Game Stats")
+                buf_tw, buf_ig = bufs["twitter"], bufs["instagram"]
                 chart_type = "bar"
                 stat_data_for_caption = stat_data
                 interactive_data = stat_data
             else:
-                buf_tw = generate_line_chart(stat_history, player_name, game_name, game_installment, size="twitter",   game_mode=batch_game_mode)
-                buf_ig = generate_line_chart(stat_history, player_name, game_name, game_installment, size="instagram", game_mode=batch_game_mode)
+                bufs = generate_chart_variants(generate_line_chart, stat_history, player_name, game_name, game_installment, game_mode=batch_game_mode)
+                buf_tw, buf_ig = bufs["twitter"], bufs["instagram"]
                 chart_type = "line"
                 stat_data_for_caption = {}
                 for i in range(1, 4):